@@ -3,6 +3,12 @@ import pandas as pd
 import time
 from typing import Dict, List, Optional
 import json
+import gzip
+import hashlib
+import html
+import io
+import zipfile
+import brotli
 
 # 🎯 PS3風デザインCSS（凍結版保護）
 def load_ps3_styles():
@@ -153,6 +159,61 @@ class TONOSAMAConfig:
     ]
     
     MENU_CATEGORIES = ["フード", "コース", "ランチ", "デザート", "ドリンク"]
+
+    TRANSLATION_LANGUAGES = {"日本語": "ja", "English": "en", "中文": "zh", "한국어": "ko"}
+
+    # 料理用語辞書（用語ごとの各言語表記を統一する）
+    CULINARY_GLOSSARY = {
+        "唐揚げ": {"English": "Karaage", "中文": "日式炸鸡", "한국어": "가라아게"},
+        "定食": {"English": "Teishoku set meal", "中文": "定食套餐", "한국어": "정식"},
+        "御膳": {"English": "Gozen", "中文": "御膳", "한국어": "고젠"},
+        "焼き魚": {"English": "Grilled fish", "中文": "烤鱼", "한국어": "생선구이"},
+        "ラーメン": {"English": "Ramen", "中文": "拉面", "한국어": "라멘"},
+        "特製": {"English": "Special", "中文": "特制", "한국어": "특제"},
+        "天ぷら": {"English": "Tempura", "中文": "天妇罗", "한국어": "덴푸라"},
+        "刺身": {"English": "Sashimi", "中文": "刺身", "한국어": "사시미"},
+        "寿司": {"English": "Sushi", "中文": "寿司", "한국어": "스시"},
+        "味噌汁": {"English": "Miso soup", "中文": "味噌汤", "한국어": "된장국"},
+        "丼": {"English": "Donburi rice bowl", "中文": "盖饭", "한국어": "덮밥"},
+        "うどん": {"English": "Udon", "中文": "乌冬面", "한국어": "우동"},
+        "そば": {"English": "Soba", "中文": "荞麦面", "한국어": "소바"},
+        "ハンバーグ": {"English": "Hamburg steak", "中文": "日式汉堡排", "한국어": "함박스테이크"},
+        "山菜": {"English": "Mountain vegetables", "中文": "山野菜", "한국어": "산나물"},
+        "冷やし中華": {"English": "Hiyashi chuka chilled noodles", "中文": "中华凉面", "한국어": "히야시추카"},
+        "天丼": {"English": "Tendon tempura rice bowl", "中文": "天妇罗盖饭", "한국어": "텐동"},
+        "かつ丼": {"English": "Katsudon pork cutlet rice bowl", "中文": "猪排盖饭", "한국어": "가츠동"},
+        "ざるそば": {"English": "Zaru soba chilled noodles", "中文": "日式冷荞麦面", "한국어": "자루소바"},
+        "海老": {"English": "Shrimp", "中文": "虾", "한국어": "새우"},
+        "豚骨": {"English": "Tonkotsu pork bone", "中文": "豚骨", "한국어": "돈코츠"}
+    }
+    
+    ALLERGEN_TRANSLATIONS = {
+        "小麦": {"English": "Wheat", "中文": "小麦", "한국어": "밀"},
+        "甲殻類": {"English": "Crustaceans", "中文": "甲壳类", "한국어": "갑각류"},
+        "卵": {"English": "Egg", "中文": "鸡蛋", "한국어": "달걀"},
+        "魚": {"English": "Fish", "中文": "鱼", "한국어": "생선"},
+        "大豆": {"English": "Soy", "中文": "大豆", "한국어": "대두"},
+        "ピーナッツ": {"English": "Peanut", "中文": "花生", "한국어": "땅콩"},
+        "牛乳": {"English": "Milk", "中文": "牛奶", "한국어": "우유"},
+        "くるみ": {"English": "Walnut", "中文": "核桃", "한국어": "호두"},
+        "セロリ": {"English": "Celery", "中文": "芹菜", "한국어": "셀러리"},
+        "マスタード": {"English": "Mustard", "中文": "芥末", "한국어": "머스터드"},
+        "ゴマ": {"English": "Sesame", "中文": "芝麻", "한국어": "참깨"},
+        "亜硫酸塩": {"English": "Sulphites", "中文": "亚硫酸盐", "한국어": "아황산염"},
+        "ルピナス": {"English": "Lupin", "中文": "羽扇豆", "한국어": "루핀"},
+        "貝": {"English": "Molluscs", "中文": "贝类", "한국어": "조개류"}
+    }
+
+    SITE_LABELS = {
+        "日本語": {"menu": "メニュー", "featured": "イチオシ", "other_menus": "その他のメニュー", "all_menus": "すべてのメニュー",
+                  "allergens": "アレルギー", "free_from": "{allergen}不使用"},
+        "English": {"menu": "Menu", "featured": "Recommended", "other_menus": "More dishes", "all_menus": "All dishes",
+                    "allergens": "Allergens", "free_from": "{allergen}-free"},
+        "中文": {"menu": "菜单", "featured": "招牌推荐", "other_menus": "其他菜品", "all_menus": "全部菜单",
+                "allergens": "过敏原", "free_from": "不含{allergen}"},
+        "한국어": {"menu": "메뉴", "featured": "추천 메뉴", "other_menus": "기타 메뉴", "all_menus": "전체 메뉴",
+                  "allergens": "알레르기", "free_from": "{allergen} 미포함"}
+    }
     
     PLANS = [
         {
@@ -195,6 +256,191 @@ def perform_ocr_simulation() -> List[MenuData]:
     mock_menus[2].allergens = ["小麦", "卵"]
     return mock_menus
 
+# 📖 料理用語辞書マッチャー
+class CulinaryGlossary:
+    """用語辞書をAho-Corasickオートマトンにまとめ、テキストを1回の走査で照合する"""
+
+    def __init__(self, glossary: Dict[str, Dict[str, str]]):
+        self.glossary = glossary
+        # 用語を逆順に登録し、右から左への走査で「各位置から始まる最長の用語」を求める
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._longest: List[Optional[str]] = [None]
+
+        for term in glossary:
+            if term:
+                self._insert(term)
+        self._build_failure_links()
+
+    def _insert(self, term: str):
+        state = 0
+        for char in reversed(term):
+            next_state = self._goto[state].get(char)
+            if next_state is None:
+                next_state = len(self._goto)
+                self._goto[state][char] = next_state
+                self._goto.append({})
+                self._fail.append(0)
+                self._longest.append(None)
+            state = next_state
+        self._longest[state] = term
+
+    def _build_failure_links(self):
+        queue = list(self._goto[0].values())
+        for state in queue:
+            for char, next_state in self._goto[state].items():
+                queue.append(next_state)
+                fallback = self._fail[state]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                self._fail[next_state] = self._goto[fallback].get(char, 0)
+                # 失敗リンク先の用語は必ず短いため、状態ごとに最長の1語だけを保持すればよい
+                if self._longest[next_state] is None:
+                    self._longest[next_state] = self._longest[self._fail[next_state]]
+
+    def find_spans(self, text: str) -> List[Dict]:
+        """重ならない最左最長一致の用語スパンを返す"""
+        longest_from: List[Optional[str]] = [None] * len(text)
+        state = 0
+        for position in range(len(text) - 1, -1, -1):
+            char = text[position]
+            while state and char not in self._goto[state]:
+                state = self._fail[state]
+            state = self._goto[state].get(char, 0)
+            longest_from[position] = self._longest[state]
+
+        spans = []
+        position = 0
+        while position < len(text):
+            term = longest_from[position]
+            if term is None:
+                position += 1
+                continue
+            spans.append({"start": position, "end": position + len(term), "term": term})
+            position += len(term)
+        return spans
+
+    def standalone_spans(self, text: str, spans: Optional[List[Dict]] = None) -> List[Dict]:
+        """別の語に埋め込まれた用語（例: 「駅のそばに」の「そば」）を除いたスパンを返す
+
+        日本語は分かち書きしないため、漢字・カタカナの前置き（「鶏の」「豚骨」など）は修飾語とみなして残し、
+        ひらがな同士・英数字同士の連結だけを語の途中とみなす。
+        送り仮名で終わる用語（「唐揚げ」など）の直後の助詞は許容し、ひらがなのみの用語だけ後ろも確かめる。
+        """
+        if spans is None:
+            spans = self.find_spans(text)
+        while True:
+            covered = set()
+            for span in spans:
+                covered.update(range(span["start"], span["end"]))
+
+            def joined(char_index: int, edge_char: str) -> bool:
+                if char_index < 0 or char_index >= len(text) or char_index in covered:
+                    return False
+                edge_class = _glossary_char_class(edge_char)
+                return edge_class is not None and _glossary_char_class(text[char_index]) == edge_class
+
+            kept = []
+            for span in spans:
+                term = span["term"]
+                if joined(span["start"] - 1, term[0]):
+                    continue
+                trailing_checked = _glossary_char_class(term[-1]) == "latin" or all(
+                    _glossary_char_class(char) == "hiragana" for char in term)
+                if trailing_checked and joined(span["end"], term[-1]):
+                    continue
+                kept.append(span)
+            if len(kept) == len(spans):
+                return kept
+            spans = kept
+
+    def rendering(self, term: str, language: str) -> str:
+        if language == "日本語":
+            return term
+        return self.glossary.get(term, {}).get(language, term)
+
+    def render(self, text: str, language: str, spans: Optional[List[Dict]] = None) -> str:
+        """用語スパンを指定言語の表記に置き換える"""
+        if spans is None:
+            spans = self.find_spans(text)
+        pieces = []
+        cursor = 0
+        for span in spans:
+            pieces.append((text[cursor:span["start"]], False))
+            pieces.append((self.rendering(span["term"], language), True))
+            cursor = span["end"]
+        pieces.append((text[cursor:], False))
+
+        # 英字の訳語が文字や数字と接する箇所にだけ空白を入れる（原文同士の境界には手を加えない）
+        rendered = ""
+        previous_is_term = False
+        for piece, is_term in pieces:
+            if not piece:
+                continue
+            if rendered and rendered[-1].isalnum() and piece[0].isalnum():
+                if (is_term and piece[0].isascii()) or (previous_is_term and rendered[-1].isascii()):
+                    rendered += " "
+            rendered += piece
+            previous_is_term = is_term
+        return rendered
+
+def _glossary_char_class(char: str) -> Optional[str]:
+    """用語境界の判定に使う文字種（英数字・ひらがな）"""
+    if char.isascii():
+        return "latin" if char.isalnum() else None
+    if "\u3041" <= char <= "\u309f":
+        return "hiragana"
+    return None
+
+@st.cache_resource
+def load_culinary_glossary() -> CulinaryGlossary:
+    """用語辞書はプロセスごとに1回だけコンパイルする"""
+    return CulinaryGlossary(TONOSAMAConfig.CULINARY_GLOSSARY)
+
+def scan_catalog_glossary(menus: List[MenuData], owner_answers: Dict[str, str]) -> List[Dict]:
+    """メニュー名・説明文・店主の回答を1回の走査で照合し、保護用語スパンと各言語表記を返す
+
+    各スパンには用語単位の各言語表記（renderings）を付けるため、翻訳工程では文全体を書き換えずに用語だけを保護・置換できる。
+    """
+    glossary = load_culinary_glossary()
+
+    entries = []
+    for menu in menus:
+        entries.append({"source": "menu", "key": menu.id, "field": "name", "text": menu.name})
+        entries.append({"source": "menu", "key": menu.id, "field": "description",
+                        "text": menu.multilingualDescriptions.get("日本語", "")})
+    for key, answer in owner_answers.items():
+        entries.append({"source": "owner_answer", "key": key, "field": "answer", "text": answer or ""})
+
+    # 区切り文字は用語に含まれないため、連結しても用語が境界をまたがない
+    separator = "\x00"
+    offsets = []
+    position = 0
+    for entry in entries:
+        offsets.append(position)
+        position += len(entry["text"]) + len(separator)
+    catalog_spans = glossary.find_spans(separator.join(entry["text"] for entry in entries))
+
+    span_index = 0
+    for entry, offset in zip(entries, offsets):
+        entry_end = offset + len(entry["text"])
+        entry["spans"] = []
+        while span_index < len(catalog_spans) and catalog_spans[span_index]["end"] <= entry_end:
+            span = catalog_spans[span_index]
+            entry["spans"].append({"start": span["start"] - offset, "end": span["end"] - offset, "term": span["term"]})
+            span_index += 1
+        entry["spans"] = glossary.standalone_spans(entry["text"], entry["spans"])
+        for span in entry["spans"]:
+            span["renderings"] = {
+                language: glossary.rendering(span["term"], language)
+                for language in TONOSAMAConfig.TRANSLATION_LANGUAGES
+            }
+        entry["renderings"] = {
+            language: glossary.render(entry["text"], language, entry["spans"])
+            for language in TONOSAMAConfig.TRANSLATION_LANGUAGES
+        }
+    return entries
+
 # 🎨 ナビゲーション表示（凍結版保護）
 def render_navigation(current_step: int):
     steps = ["プラン", "ログイン", "メニュー", "詳細設定", "店主の想い", "イチオシ", "完成！"]
@@ -610,6 +856,19 @@ def render_completion():
                 mime="text/csv",
                 use_container_width=True
             )
+            
+            # サイト生成（brotli圧縮を含む）は重いため、再実行のたびではなくボタン押下時のみ行う
+            if st.button("🌐 多言語メニューサイトを生成", use_container_width=True):
+                with st.spinner("サイト生成中..."):
+                    st.session_state.static_site_zip = generate_static_site_zip()
+            if st.session_state.get("static_site_zip"):
+                st.download_button(
+                    label="📦 多言語メニューサイト（ZIP）をダウンロード",
+                    data=st.session_state.static_site_zip,
+                    file_name=f"tonosama_site_{st.session_state.get('store_id', 'export')}.zip",
+                    mime="application/zip",
+                    use_container_width=True
+                )
     
     st.markdown('</div>', unsafe_allow_html=True)
 
@@ -638,6 +897,192 @@ def generate_csv_output() -> str:
     
     return "\n".join(csv_data)
 
+# 🌐 静的メニューサイト出力
+STATIC_SITE_CSS = """
+body { margin: 0; font-family: sans-serif; background: #0f1419; color: #e5e7eb; }
+header, main, nav { max-width: 720px; margin: 0 auto; padding: 1rem; }
+h1 { color: #3b82f6; }
+h2 { color: #f59e0b; }
+nav a { color: #9ca3af; margin-right: 0.75rem; }
+.menu-item { border: 1px solid #374151; border-radius: 12px; padding: 1rem; margin: 0.5rem 0; }
+.menu-item.featured { border: 2px solid rgba(245, 158, 11, 0.5); background: rgba(245, 158, 11, 0.15); }
+.menu-item img { max-width: 100%; border-radius: 8px; }
+.price { color: #10b981; font-weight: bold; }
+.allergens, .notice { color: #9ca3af; font-size: 0.9rem; }
+"""
+
+STATIC_SITE_ASSET_CACHE = "public, max-age=31536000, immutable"
+STATIC_SITE_PAGE_CACHE = "public, max-age=300"
+
+# nginx の server ブロックで include する設定（事前圧縮ファイルの配信とキャッシュ方針を両立させる）
+STATIC_SITE_NGINX_CONF = f"""# TONOSAMA 多言語メニューサイト
+# server {{ root <展開先>; include <展開先>/nginx.conf; }} のように読み込む
+# brotli_static には ngx_brotli モジュールが必要
+index index.html;
+gzip_static on;
+brotli_static on;
+
+location /assets/ {{
+    add_header Cache-Control "{STATIC_SITE_ASSET_CACHE}" always;
+    add_header Vary Accept-Encoding always;
+}}
+
+location / {{
+    add_header Cache-Control "{STATIC_SITE_PAGE_CACHE}" always;
+    add_header Vary Accept-Encoding always;
+}}
+
+location = /nginx.conf {{ return 404; }}
+location = /_headers {{ return 404; }}
+"""
+
+def _fingerprint(content: bytes) -> str:
+    return hashlib.sha256(content).hexdigest()[:12]
+
+def _allergen_slug(allergen: str) -> str:
+    return TONOSAMAConfig.ALLERGEN_TRANSLATIONS[allergen]["English"].lower().replace(" ", "-")
+
+def _allergen_label(allergen: str, language: str) -> str:
+    if language == "日本語":
+        return allergen
+    return TONOSAMAConfig.ALLERGEN_TRANSLATIONS.get(allergen, {}).get(language, allergen)
+
+def _render_site_page(language: str, title: str, store_name: str, css_path: str, nav_links: List[tuple], body: str) -> bytes:
+    code = TONOSAMAConfig.TRANSLATION_LANGUAGES[language]
+    nav = "".join(f'<a href="{html.escape(href)}">{html.escape(label)}</a>' for label, href in nav_links)
+    page = f"""<!DOCTYPE html>
+<html lang="{code}">
+<head>
+<meta charset="utf-8">
+<meta name="viewport" content="width=device-width, initial-scale=1">
+<title>{html.escape(title)} | {html.escape(store_name)}</title>
+<link rel="stylesheet" href="{css_path}">
+</head>
+<body>
+<header><h1>🏮 {html.escape(store_name)}</h1></header>
+<nav>{nav}</nav>
+<main>
+<h2>{html.escape(title)}</h2>
+{body}
+</main>
+</body>
+</html>
+"""
+    return page.encode("utf-8")
+
+def build_static_site() -> Dict[str, bytes]:
+    """完成したセッションから多言語の静的メニューサイトを生成（パス→内容）"""
+    menus = [m for m in st.session_state.get("menus", []) if m.shouldIntroduce]
+    owner_answers = st.session_state.get("owner_answers", {})
+    featured_ids = [fm.id for fm in st.session_state.get("featured_menus", [])]
+    allergy_policy = st.session_state.get("allergy_policy", "")
+    show_allergens = allergy_policy == "全メニューにアレルギー情報を表示する"
+    disclaimer = st.session_state.get("allergy_disclaimer", "") if allergy_policy == "店内の注意書きのみとする" else ""
+
+    entries = scan_catalog_glossary(menus, owner_answers)
+    renderings = {(e["source"], e["key"], e["field"]): e["renderings"] for e in entries}
+
+    files = {}
+    css = STATIC_SITE_CSS.encode("utf-8")
+    css_name = f"assets/menu.{_fingerprint(css)}.css"
+    files[css_name] = css
+
+    present_allergens = [a for a in TONOSAMAConfig.COMMON_ALLERGENS if any(a in m.allergens for m in menus)]
+    # 店名は固有名詞のため用語辞書を通さずそのまま使う。公開サイトなので店舗ID（認証情報）は出さない
+    store_name = owner_answers.get("restaurant_name", "").strip() or "TONOSAMA"
+
+    index = {"storeName": store_name, "languages": {}, "menus": []}
+    for menu in menus:
+        index["menus"].append({
+            "id": menu.id,
+            "price": menu.price,
+            "category": menu.category,
+            "featured": menu.id in featured_ids,
+            "imageUrl": menu.imageUrl,
+            "allergens": menu.allergens if show_allergens else [],
+            "names": renderings[("menu", menu.id, "name")],
+            "descriptions": {lang: text for lang, text in menu.multilingualDescriptions.items() if text}
+        })
+
+    def render_menu_item(menu: MenuData, language: str, heading: str = "h3") -> str:
+        name = renderings[("menu", menu.id, "name")][language]
+        description = menu.multilingualDescriptions.get(language) or menu.multilingualDescriptions.get("日本語", "")
+        classes = "menu-item featured" if menu.id in featured_ids else "menu-item"
+        parts = [f'<article class="{classes}" id="menu-{menu.id}">']
+        if menu.id in featured_ids and menu.imageUrl:
+            parts.append(f'<img src="{html.escape(menu.imageUrl)}" alt="{html.escape(name)}" loading="lazy">')
+        parts.append(f'<{heading}>{"⭐ " if menu.id in featured_ids else ""}{html.escape(name)}</{heading}>')
+        parts.append(f'<p class="price">{html.escape(menu.price)}</p>')
+        if description:
+            parts.append(f'<p>{html.escape(description)}</p>')
+        if show_allergens and menu.allergens:
+            labels = ", ".join(_allergen_label(a, language) for a in menu.allergens)
+            parts.append(f'<p class="allergens">{html.escape(TONOSAMAConfig.SITE_LABELS[language]["allergens"])}: {html.escape(labels)}</p>')
+        parts.append('</article>')
+        return "\n".join(parts)
+
+    for language, code in TONOSAMAConfig.TRANSLATION_LANGUAGES.items():
+        labels = TONOSAMAConfig.SITE_LABELS[language]
+        css_path = f"../{css_name}"
+        nav_links = [(labels["all_menus"], "index.html")]
+        nav_links += [(labels["free_from"].format(allergen=_allergen_label(a, language)), f"free-from-{_allergen_slug(a)}.html")
+                      for a in (present_allergens if show_allergens else [])]
+        nav_links += [(other, f"../{other_code}/index.html") for other, other_code in TONOSAMAConfig.TRANSLATION_LANGUAGES.items() if other != language]
+        notice = f'<p class="notice">{html.escape(disclaimer)}</p>' if disclaimer else ""
+
+        # イチオシは先頭のセクションに1回だけ表示し、残りのメニューは別セクションにまとめる
+        featured = [m for m in menus if m.id in featured_ids]
+        others = [m for m in menus if m.id not in featured_ids]
+        if featured:
+            body = f'<section><h3>{html.escape(labels["featured"])}</h3>\n'
+            body += "\n".join(render_menu_item(m, language, heading="h4") for m in featured) + '</section>\n'
+            if others:
+                body += f'<section><h3>{html.escape(labels["other_menus"])}</h3>\n'
+                body += "\n".join(render_menu_item(m, language, heading="h4") for m in others) + '</section>\n'
+        else:
+            body = "\n".join(render_menu_item(m, language) for m in menus)
+        body += notice
+        files[f"{code}/index.html"] = _render_site_page(language, labels["menu"], store_name, css_path, nav_links, body)
+        pages = {"index": f"{code}/index.html"}
+
+        if show_allergens:
+            for allergen in present_allergens:
+                title = labels["free_from"].format(allergen=_allergen_label(allergen, language))
+                filtered_body = "\n".join(render_menu_item(m, language) for m in menus if allergen not in m.allergens)
+                path = f"{code}/free-from-{_allergen_slug(allergen)}.html"
+                files[path] = _render_site_page(language, title, store_name, css_path, nav_links, filtered_body)
+                pages[f"free-from-{_allergen_slug(allergen)}"] = path
+
+        index["languages"][code] = {"name": language, "pages": pages}
+
+    files["index.json"] = json.dumps(index, ensure_ascii=False).encode("utf-8")
+    language_links = "".join(f'<li><a href="{code}/index.html">{html.escape(language)}</a></li>'
+                             for language, code in TONOSAMAConfig.TRANSLATION_LANGUAGES.items())
+    files["index.html"] = _render_site_page("日本語", "Language / 言語", store_name,
+                                            css_name, [], f"<ul>{language_links}</ul>")
+    # nginx.conf は事前圧縮ファイルとキャッシュ方針の両方を適用する。_headers はNetlify等向け（圧縮は配信側が行う）
+    files["nginx.conf"] = STATIC_SITE_NGINX_CONF.encode("utf-8")
+    # _headers は一致した全ルールのヘッダーを合成するため、ルール同士が重ならないようにパスを列挙する
+    header_rules = [("/assets/*", STATIC_SITE_ASSET_CACHE)]
+    header_rules += [(path, STATIC_SITE_PAGE_CACHE) for path in ["/", "/index.html", "/index.json"]]
+    header_rules += [(f"/{code}/*", STATIC_SITE_PAGE_CACHE) for code in TONOSAMAConfig.TRANSLATION_LANGUAGES.values()]
+    files["_headers"] = "".join(f"{path}\n  Cache-Control: {value}\n" for path, value in header_rules).encode("utf-8")
+
+    # 配信時に圧縮しなくて済むよう、テキスト資産はgzip・brotliで事前圧縮しておく
+    for path, content in list(files.items()):
+        if path.endswith((".html", ".css", ".json")):
+            files[path + ".gz"] = gzip.compress(content, compresslevel=9, mtime=0)
+            files[path + ".br"] = brotli.compress(content, quality=11)
+    return files
+
+def generate_static_site_zip() -> bytes:
+    """静的メニューサイトをZIP形式でまとめる"""
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w", zipfile.ZIP_DEFLATED) as archive:
+        for path, content in sorted(build_static_site().items()):
+            archive.writestr(path, content)
+    return buffer.getvalue()
+
 # 🎮 メイン関数（凍結版保護）
 def main():
     # ページ設定